@@ -0,0 +1,53 @@
+namespace TodoApi.Tests.Data;
+
+using Microsoft.Data.Sqlite;
+using Microsoft.EntityFrameworkCore;
+using TodoApi.Data;
+using Xunit;
+
+public class MigrationsTests : IDisposable
+{
+    private readonly SqliteConnection _connection;
+    private readonly ApplicationDbContext _context;
+
+    public MigrationsTests()
+    {
+        // Keep the connection open so the in-memory database lives for the whole test
+        _connection = new SqliteConnection("DataSource=:memory:");
+        _connection.Open();
+
+        var options = new DbContextOptionsBuilder<ApplicationDbContext>()
+            .UseSqlite(_connection)
+            .Options;
+
+        _context = new ApplicationDbContext(options);
+    }
+
+    [Fact]
+    public void Model_ShouldHaveNoPendingChanges()
+    {
+        Assert.False(_context.Database.HasPendingModelChanges());
+    }
+
+    [Fact]
+    public async Task Migrate_ShouldCreateTodoIndexes()
+    {
+        // Act
+        await _context.Database.MigrateAsync();
+
+        // Assert
+        var indexes = await _context.Database
+            .SqlQueryRaw<string>("SELECT name AS Value FROM sqlite_master WHERE type = 'index' AND tbl_name = 'Todos'")
+            .ToListAsync();
+
+        Assert.Contains("IX_Todos_UserId_CreatedAt", indexes);
+        Assert.Contains("IX_Todos_CreatedAt", indexes);
+        Assert.DoesNotContain("IX_Todos_UserId", indexes);
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _connection.Dispose();
+    }
+}
@@ -0,0 +1,87 @@
+namespace TodoApi.Tests.Features.Todos;
+
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Logging;
+using Moq;
+using TodoApi.Data;
+using TodoApi.Features.Todos.Commands.DeleteTodo;
+using TodoApi.Models;
+using Xunit;
+
+public class DeleteTodoHandlerTests
+{
+    private readonly ApplicationDbContext _context;
+    private readonly DeleteTodoHandler _handler;
+
+    public DeleteTodoHandlerTests()
+    {
+        var options = new DbContextOptionsBuilder<ApplicationDbContext>()
+            .UseInMemoryDatabase(databaseName: Guid.NewGuid().ToString())
+            .Options;
+
+        _context = new ApplicationDbContext(options);
+        var logger = new Mock<ILogger<DeleteTodoHandler>>().Object;
+        _handler = new DeleteTodoHandler(_context, logger);
+    }
+
+    private async Task<Todo> SeedTodoAsync(string userId)
+    {
+        var todo = new Todo
+        {
+            Id = Guid.NewGuid(),
+            Title = "Test Todo",
+            CreatedAt = DateTime.UtcNow,
+            UpdatedAt = DateTime.UtcNow,
+            UserId = userId
+        };
+
+        _context.Todos.Add(todo);
+        await _context.SaveChangesAsync();
+        _context.ChangeTracker.Clear();
+
+        return todo;
+    }
+
+    [Fact]
+    public async Task Handle_ShouldDeleteTodo_WhenOwnedByUser()
+    {
+        // Arrange
+        var todo = await SeedTodoAsync("test-user");
+        var command = new DeleteTodoCommand { UserId = "test-user", TodoId = todo.Id };
+
+        // Act
+        var result = await _handler.Handle(command, CancellationToken.None);
+
+        // Assert
+        Assert.True(result);
+        Assert.False(await _context.Todos.AnyAsync(t => t.Id == todo.Id));
+    }
+
+    [Fact]
+    public async Task Handle_ShouldReturnFalse_WhenTodoDoesNotExist()
+    {
+        // Arrange
+        var command = new DeleteTodoCommand { UserId = "test-user", TodoId = Guid.NewGuid() };
+
+        // Act
+        var result = await _handler.Handle(command, CancellationToken.None);
+
+        // Assert
+        Assert.False(result);
+    }
+
+    [Fact]
+    public async Task Handle_ShouldReturnFalse_WhenTodoBelongsToAnotherUser()
+    {
+        // Arrange
+        var todo = await SeedTodoAsync("other-user");
+        var command = new DeleteTodoCommand { UserId = "test-user", TodoId = todo.Id };
+
+        // Act
+        var result = await _handler.Handle(command, CancellationToken.None);
+
+        // Assert
+        Assert.False(result);
+        Assert.True(await _context.Todos.AnyAsync(t => t.Id == todo.Id));
+    }
+}
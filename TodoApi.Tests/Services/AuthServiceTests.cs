@@ -0,0 +1,61 @@
+namespace TodoApi.Tests.Services;
+
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Identity;
+using Microsoft.Extensions.Options;
+using Moq;
+using TodoApi.Configuration;
+using TodoApi.Services;
+using Xunit;
+
+public class AuthServiceTests
+{
+    private const string ExistingEmail = "existing@example.com";
+
+    private readonly Mock<UserManager<IdentityUser>> _userManager;
+    private readonly AuthService _service;
+
+    public AuthServiceTests()
+    {
+        _userManager = new Mock<UserManager<IdentityUser>>(
+            Mock.Of<IUserStore<IdentityUser>>(), null!, null!, null!, null!, null!, null!, null!, null!);
+
+        _userManager
+            .Setup(m => m.FindByEmailAsync(ExistingEmail))
+            .ReturnsAsync(new IdentityUser { UserName = ExistingEmail, Email = ExistingEmail });
+
+        // Mirror Identity's ordering: password validation fails before the uniqueness check runs
+        _userManager
+            .Setup(m => m.CreateAsync(It.IsAny<IdentityUser>(), "password1"))
+            .ReturnsAsync(IdentityResult.Failed(new IdentityErrorDescriber().PasswordRequiresUpper()));
+
+        var signInManager = new Mock<SignInManager<IdentityUser>>(
+            _userManager.Object,
+            Mock.Of<IHttpContextAccessor>(),
+            Mock.Of<IUserClaimsPrincipalFactory<IdentityUser>>(),
+            null!, null!, null!, null!);
+
+        var jwtSettings = Options.Create(new JwtSettings
+        {
+            SecretKey = "test-secret-key-that-is-at-least-32-bytes-long",
+            Issuer = "test-issuer",
+            Audience = "test-audience"
+        });
+
+        _service = new AuthService(_userManager.Object, signInManager.Object, jwtSettings);
+    }
+
+    [Theory]
+    [InlineData("Password1")]
+    [InlineData("password1")]
+    public async Task RegisterUserAsync_ShouldReportDuplicate_WhenEmailExists(string password)
+    {
+        // Act
+        var (succeeded, errorMessage) = await _service.RegisterUserAsync(ExistingEmail, password);
+
+        // Assert
+        Assert.False(succeeded);
+        Assert.Equal("User with this email already exists", errorMessage);
+        _userManager.Verify(m => m.CreateAsync(It.IsAny<IdentityUser>(), It.IsAny<string>()), Times.Never);
+    }
+}
@@ -25,8 +25,10 @@ public class ApplicationDbContext : IdentityDbContext
             entity.HasKey(t => t.Id);
 
             // Indexes for performance
-            entity.HasIndex(t => t.UserId)
-                .HasDatabaseName("IX_Todos_UserId");
+            // Serves the per-user listing (filter by UserId, order by CreatedAt)
+            // and doubles as the foreign key index on UserId
+            entity.HasIndex(t => new { t.UserId, t.CreatedAt })
+                .HasDatabaseName("IX_Todos_UserId_CreatedAt");
 
             entity.HasIndex(t => t.CreatedAt)
                 .HasDatabaseName("IX_Todos_CreatedAt");
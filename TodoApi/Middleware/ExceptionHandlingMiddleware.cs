@@ -55,10 +55,7 @@ public class ExceptionHandlingMiddleware
             errors
         };
 
-        context.Response.ContentType = "application/json";
-        context.Response.StatusCode = (int)HttpStatusCode.BadRequest;
-
-        await context.Response.WriteAsync(JsonSerializer.Serialize(response));
+        await WriteJsonResponseAsync(context, HttpStatusCode.BadRequest, response);
     }
 
     private async Task HandleUnauthorizedExceptionAsync(HttpContext context, UnauthorizedAccessException exception)
@@ -67,10 +64,7 @@ public class ExceptionHandlingMiddleware
 
         var response = new { message = exception.Message };
 
-        context.Response.ContentType = "application/json";
-        context.Response.StatusCode = (int)HttpStatusCode.Unauthorized;
-
-        await context.Response.WriteAsync(JsonSerializer.Serialize(response));
+        await WriteJsonResponseAsync(context, HttpStatusCode.Unauthorized, response);
     }
 
     private async Task HandleExceptionAsync(HttpContext context, Exception exception)
@@ -79,9 +73,14 @@ public class ExceptionHandlingMiddleware
 
         var response = new { message = "An error occurred processing your request" };
 
+        await WriteJsonResponseAsync(context, HttpStatusCode.InternalServerError, response);
+    }
+
+    private static async Task WriteJsonResponseAsync<T>(HttpContext context, HttpStatusCode statusCode, T response)
+    {
         context.Response.ContentType = "application/json";
-        context.Response.StatusCode = (int)HttpStatusCode.InternalServerError;
+        context.Response.StatusCode = (int)statusCode;
 
-        await context.Response.WriteAsync(JsonSerializer.Serialize(response));
+        await JsonSerializer.SerializeAsync(context.Response.Body, response, cancellationToken: context.RequestAborted);
     }
 }
@@ -242,8 +242,8 @@ namespace TodoApi.Migrations
                     b.HasIndex("CreatedAt")
                         .HasDatabaseName("IX_Todos_CreatedAt");
 
-                    b.HasIndex("UserId")
-                        .HasDatabaseName("IX_Todos_UserId");
+                    b.HasIndex("UserId", "CreatedAt")
+                        .HasDatabaseName("IX_Todos_UserId_CreatedAt");
 
                     b.ToTable("Todos");
                 });
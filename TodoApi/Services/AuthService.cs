@@ -70,8 +70,11 @@ public class AuthService : IAuthService
         }
 
         // Generate JWT token
-        var token = GenerateJwtToken(user);
-        var expiresAt = DateTime.UtcNow.AddMinutes(_jwtSettings.ExpirationMinutes);
+        // JWT iat/exp are whole seconds; truncate so ExpiresAt matches the token's exp claim
+        var now = DateTime.UtcNow;
+        var issuedAt = now.AddTicks(-(now.Ticks % TimeSpan.TicksPerSecond));
+        var expiresAt = issuedAt.AddMinutes(_jwtSettings.ExpirationMinutes);
+        var token = GenerateJwtToken(user, issuedAt, expiresAt);
 
         var response = new AuthResponseDto
         {
@@ -82,14 +85,14 @@ public class AuthService : IAuthService
         return (response, null);
     }
 
-    private string GenerateJwtToken(IdentityUser user)
+    private string GenerateJwtToken(IdentityUser user, DateTime issuedAt, DateTime expiresAt)
     {
-        var claims = new List<Claim>
+        var claims = new[]
         {
             new Claim(JwtRegisteredClaimNames.Sub, user.Id),
             new Claim(JwtRegisteredClaimNames.Email, user.Email!),
             new Claim(JwtRegisteredClaimNames.Jti, Guid.NewGuid().ToString()),
-            new Claim(JwtRegisteredClaimNames.Iat, DateTimeOffset.UtcNow.ToUnixTimeSeconds().ToString(), ClaimValueTypes.Integer64)
+            new Claim(JwtRegisteredClaimNames.Iat, new DateTimeOffset(issuedAt).ToUnixTimeSeconds().ToString(), ClaimValueTypes.Integer64)
         };
 
         var key = new SymmetricSecurityKey(Encoding.UTF8.GetBytes(_jwtSettings.SecretKey));
@@ -99,7 +102,7 @@ public class AuthService : IAuthService
             issuer: _jwtSettings.Issuer,
             audience: _jwtSettings.Audience,
             claims: claims,
-            expires: DateTime.UtcNow.AddMinutes(_jwtSettings.ExpirationMinutes),
+            expires: expiresAt,
             signingCredentials: credentials
         );
 